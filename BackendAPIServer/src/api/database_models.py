@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Text, func
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Index, Text, func
 from sqlalchemy.orm import declarative_base, relationship
 
 Base = declarative_base()
@@ -12,20 +12,29 @@ class User(Base):
     email = Column(String(255), unique=True, nullable=False, index=True)
     hashed_password = Column(String(255), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
-    tasks = relationship("Task", back_populates="owner", cascade="all, delete")
+    # raise_on_sql turns silent per-row lazy loads (N+1, MissingGreenlet under
+    # asyncio) into a loud error; opt in with selectinload where traversal is needed.
+    tasks = relationship("Task", back_populates="owner", cascade="all, delete", lazy="raise_on_sql")
 
 class Task(Base):
     """Database model for tasks."""
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Composite indexes cover the owner-scoped lookups; they also serve
+        # plain owner_id filters, so no standalone owner_id index is needed.
+        Index("ix_tasks_owner_id_id", "owner_id", "id"),
+        Index("ix_tasks_owner_id_completed", "owner_id", "completed"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(200), nullable=False, index=True)
     description = Column(Text, nullable=True)
     completed = Column(Boolean, default=False, nullable=False)
     due_date = Column(DateTime, nullable=True)
-    owner_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    owner_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
-    owner = relationship("User", back_populates="tasks")
+    owner = relationship("User", back_populates="tasks", lazy="raise_on_sql")
@@ -1,7 +1,6 @@
 import os
 from typing import AsyncGenerator
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine, AsyncSession
 
 # Uses .env variables - should be set in deployment config/environment
 DB_USER = os.getenv("POSTGRES_USER")
@@ -12,11 +11,35 @@ DB_PORT = os.getenv("POSTGRES_PORT", "5432")
 
 DATABASE_URL = f"postgresql+asyncpg://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 
-engine = create_async_engine(DATABASE_URL, future=True, echo=False)
-SessionLocal = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+# Pool sizing for concurrent request load. Keep workers * pool_size below the
+# Postgres max_connections limit when scaling uvicorn workers.
+engine = create_async_engine(
+    DATABASE_URL,
+    future=True,
+    echo=False,
+    pool_size=20,
+    max_overflow=30,
+    pool_timeout=30,
+    pool_pre_ping=True,
+    pool_recycle=3600,
+)
+# autoflush off because endpoints commit explicitly; avoids identity-map
+# probing on every execute
+SessionLocal = async_sessionmaker(engine, expire_on_commit=False, autoflush=False)
+
+# AUTOCOMMIT variant shares the same pool but skips the BEGIN/ROLLBACK
+# round-trips an implicit transaction adds to pure SELECT endpoints
+ro_engine = engine.execution_options(isolation_level="AUTOCOMMIT")
+ReadOnlySessionLocal = async_sessionmaker(ro_engine, expire_on_commit=False, autoflush=False)
 
 # PUBLIC_INTERFACE
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """Provide an async DB session for FastAPI dependencies."""
     async with SessionLocal() as session:
         yield session
+
+# PUBLIC_INTERFACE
+async def get_ro_session() -> AsyncGenerator[AsyncSession, None]:
+    """Provide an autocommit async DB session for read-only endpoints."""
+    async with ReadOnlySessionLocal() as session:
+        yield session
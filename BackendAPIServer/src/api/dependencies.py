@@ -3,15 +3,32 @@ from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
-from .db import get_session
+from .db import get_ro_session
 from .database_models import User
 from .security import decode_access_token
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
+# PUBLIC_INTERFACE
+async def get_current_user_id(token: str = Depends(oauth2_scheme)) -> int:
+    """Dependency to get the authenticated user's id without a DB round-trip.
+
+    The JWT signature already guarantees the uid claim is authentic, so
+    endpoints that only need to scope queries by owner can skip the user
+    SELECT entirely.
+    """
+    payload = decode_access_token(token)
+    if payload is None or "uid" not in payload:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return int(payload["uid"])
+
 # PUBLIC_INTERFACE
 async def get_current_user(
-    token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_session)
+    token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_ro_session)
 ) -> User:
     """Dependency to get the currently authenticated user by JWT token."""
     credentials_exception = HTTPException(
@@ -23,7 +40,7 @@ async def get_current_user(
     if payload is None or "sub" not in payload:
         raise credentials_exception
     username: str = payload["sub"]
-    query = select(User).where(User.username == username)
+    query = select(User).where(User.username == username).limit(1)
     result = await db.execute(query)
     user = result.scalar_one_or_none()
     if user is None:
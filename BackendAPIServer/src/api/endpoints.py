@@ -1,130 +1,139 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select
+import asyncio
+import hashlib
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy import bindparam, delete, lambda_stmt, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
 from . import models
-from .db import get_session
+from .db import get_ro_session, get_session
 from .database_models import User, Task
 from .security import get_password_hash, verify_password, create_access_token
-from .dependencies import get_current_user
+from .dependencies import get_current_user, get_current_user_id
 
 router = APIRouter()
 
+# Statements built once via lambda_stmt so SQL construction and compilation are
+# cached across requests; parameters are supplied at execute time.
+_list_tasks_stmt = lambda_stmt(
+    lambda: select(
+        Task.id,
+        Task.title,
+        Task.description,
+        Task.completed,
+        Task.due_date,
+        Task.owner_id,
+        Task.created_at,
+        Task.updated_at,
+    ).where(Task.owner_id == bindparam("owner_id"))
+)
+_get_task_stmt = lambda_stmt(
+    lambda: select(
+        Task.id,
+        Task.title,
+        Task.description,
+        Task.completed,
+        Task.due_date,
+        Task.owner_id,
+        Task.created_at,
+        Task.updated_at,
+    )
+    .where(Task.id == bindparam("task_id"), Task.owner_id == bindparam("owner_id"))
+    .limit(1)
+)
+_delete_task_stmt = lambda_stmt(
+    lambda: delete(Task)
+    .where(Task.id == bindparam("task_id"), Task.owner_id == bindparam("owner_id"))
+    .returning(Task.id)
+    .execution_options(synchronize_session=False)
+)
+
 # ===== AUTH ENDPOINTS =====
 
 @router.post("/auth/register", response_model=models.UserRead, summary="Register a new user")
 # PUBLIC_INTERFACE
 async def register_user(user_in: models.UserRegistration, db: AsyncSession = Depends(get_session)):
     """Register a new user with unique username and email."""
-    # Check if username or email taken
-    user_q = select(User).where((User.username == user_in.username) | (User.email == user_in.email))
-    existing = await db.execute(user_q)
-    if existing.scalar_one_or_none():
-        raise HTTPException(status_code=400, detail="Username or email already in use.")
-    # Create user
-    user_obj = User(
-        username=user_in.username,
-        email=user_in.email,
-        hashed_password=get_password_hash(user_in.password),
+    # Hash first (in a worker thread so the CPU-bound KDF does not block the
+    # event loop) to keep the transaction as short as possible
+    hashed_password = await asyncio.to_thread(get_password_hash, user_in.password)
+    # Single INSERT ... ON CONFLICT DO NOTHING RETURNING round-trip; the unique
+    # constraints on username/email replace the racy SELECT-then-INSERT check
+    stmt = (
+        pg_insert(User)
+        .values(username=user_in.username, email=user_in.email, hashed_password=hashed_password)
+        .on_conflict_do_nothing()
+        .returning(User.id, User.username, User.email, User.created_at)
     )
-    db.add(user_obj)
+    row = (await db.execute(stmt)).mappings().first()
+    if row is None:
+        raise HTTPException(status_code=400, detail="Username or email already in use.")
     await db.commit()
-    await db.refresh(user_obj)
-    return models.UserRead(
-        id=user_obj.id, username=user_obj.username, email=user_obj.email, created_at=user_obj.created_at
-    )
+    return row
 
 @router.post("/auth/login", response_model=models.Token, summary="Login")
 # PUBLIC_INTERFACE
 async def login_user(user_in: models.UserLogin, db: AsyncSession = Depends(get_session)):
     """Authenticate user and return JWT access token."""
-    q = select(User).where(User.username == user_in.username)
+    q = select(User).where(User.username == user_in.username).limit(1)
     result = await db.execute(q)
     user = result.scalar_one_or_none()
-    if not user or not verify_password(user_in.password, user.hashed_password):
+    if not user or not await asyncio.to_thread(verify_password, user_in.password, user.hashed_password):
         raise HTTPException(status_code=401, detail="Incorrect username or password.")
-    token = create_access_token(data={"sub": user.username})
+    token = create_access_token(data={"sub": user.username, "uid": user.id})
     return models.Token(access_token=token, token_type="bearer")
 
 # ===== USER PROFILE =====
 
 @router.get("/users/me", response_model=models.UserRead, summary="Get my profile")
 # PUBLIC_INTERFACE
-async def get_my_profile(current_user: User = Depends(get_current_user)):
+async def get_my_profile(request: Request, response: Response, current_user: User = Depends(get_current_user)):
     """Get details of the current authenticated user."""
-    return models.UserRead(
-        id=current_user.id,
-        username=current_user.username,
-        email=current_user.email,
-        created_at=current_user.created_at,
+    # Profile data only changes when the user row does, so a conditional GET
+    # keyed on (id, updated_at) lets pollers skip the body entirely
+    etag = '"{}"'.format(
+        hashlib.sha1(f"{current_user.id}:{current_user.updated_at.timestamp()}".encode()).hexdigest()
     )
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+    response.headers["ETag"] = etag
+    return current_user
 
 # ===== TASK CRUD ENDPOINTS =====
 
 @router.post("/tasks/", response_model=models.TaskRead, summary="Create a new task")
 # PUBLIC_INTERFACE
-async def create_task(task_in: models.TaskCreate, db: AsyncSession = Depends(get_session), current_user: User = Depends(get_current_user)):
+async def create_task(task_in: models.TaskCreate, db: AsyncSession = Depends(get_session), user_id: int = Depends(get_current_user_id)):
     """Create a new task for the authenticated user."""
     task = Task(
         title=task_in.title,
         description=task_in.description,
         due_date=task_in.due_date,
-        owner_id=current_user.id,
+        owner_id=user_id,
     )
     db.add(task)
     await db.commit()
     await db.refresh(task)
-    return models.TaskRead(
-        id=task.id,
-        title=task.title,
-        description=task.description,
-        completed=task.completed,
-        due_date=task.due_date,
-        owner_id=task.owner_id,
-        created_at=task.created_at,
-        updated_at=task.updated_at,
-    )
+    return task
 
 @router.get("/tasks/", response_model=List[models.TaskRead], summary="List all my tasks")
 # PUBLIC_INTERFACE
-async def list_tasks(db: AsyncSession = Depends(get_session), current_user: User = Depends(get_current_user)):
+async def list_tasks(db: AsyncSession = Depends(get_ro_session), user_id: int = Depends(get_current_user_id)):
     """List all tasks belonging to the authenticated user."""
-    q = select(Task).where(Task.owner_id == current_user.id)
-    tasks = (await db.execute(q)).scalars().all()
-    return [
-        models.TaskRead(
-            id=task.id,
-            title=task.title,
-            description=task.description,
-            completed=task.completed,
-            due_date=task.due_date,
-            owner_id=task.owner_id,
-            created_at=task.created_at,
-            updated_at=task.updated_at,
-        )
-        for task in tasks
-    ]
+    # Core column select skips ORM instance construction for this read-only path
+    rows = (await db.execute(_list_tasks_stmt, {"owner_id": user_id})).mappings().all()
+    return rows
 
 @router.get("/tasks/{task_id}", response_model=models.TaskRead, summary="Get a specific task")
 # PUBLIC_INTERFACE
-async def get_task(task_id: int, db: AsyncSession = Depends(get_session), current_user: User = Depends(get_current_user)):
+async def get_task(task_id: int, db: AsyncSession = Depends(get_ro_session), user_id: int = Depends(get_current_user_id)):
     """Get a single task by ID if owned by the authenticated user."""
-    q = select(Task).where(Task.id == task_id, Task.owner_id == current_user.id)
-    result = await db.execute(q)
-    task = result.scalar_one_or_none()
-    if not task:
+    row = (await db.execute(_get_task_stmt, {"task_id": task_id, "owner_id": user_id})).mappings().first()
+    if row is None:
         raise HTTPException(status_code=404, detail="Task not found.")
-    return models.TaskRead(
-        id=task.id,
-        title=task.title,
-        description=task.description,
-        completed=task.completed,
-        due_date=task.due_date,
-        owner_id=task.owner_id,
-        created_at=task.created_at,
-        updated_at=task.updated_at,
-    )
+    return row
 
 @router.put("/tasks/{task_id}", response_model=models.TaskRead, summary="Update a task")
 # PUBLIC_INTERFACE
@@ -132,38 +141,37 @@ async def update_task(
     task_id: int,
     task_in: models.TaskUpdate,
     db: AsyncSession = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
 ):
     """Update a task's fields if owned by the authenticated user."""
-    q = select(Task).where(Task.id == task_id, Task.owner_id == current_user.id)
-    result = await db.execute(q)
+    values = task_in.model_dump(exclude_unset=True)
+    if values:
+        # Single UPDATE ... RETURNING round-trip; no prior SELECT needed
+        stmt = (
+            update(Task)
+            .where(Task.id == task_id, Task.owner_id == user_id)
+            .values(**values)
+            .returning(Task)
+            .execution_options(synchronize_session=False)
+        )
+    else:
+        # Nothing to change; just fetch the task for the response
+        stmt = select(Task).where(Task.id == task_id, Task.owner_id == user_id)
+    result = await db.execute(stmt)
     task = result.scalar_one_or_none()
     if not task:
         raise HTTPException(status_code=404, detail="Task not found.")
-    for key, value in task_in.model_dump(exclude_unset=True).items():
-        setattr(task, key, value)
     await db.commit()
-    await db.refresh(task)
-    return models.TaskRead(
-        id=task.id,
-        title=task.title,
-        description=task.description,
-        completed=task.completed,
-        due_date=task.due_date,
-        owner_id=task.owner_id,
-        created_at=task.created_at,
-        updated_at=task.updated_at,
-    )
+    return task
 
 @router.delete("/tasks/{task_id}", status_code=204, summary="Delete a task")
 # PUBLIC_INTERFACE
-async def delete_task(task_id: int, db: AsyncSession = Depends(get_session), current_user: User = Depends(get_current_user)):
+async def delete_task(task_id: int, db: AsyncSession = Depends(get_session), user_id: int = Depends(get_current_user_id)):
     """Delete a task owned by the authenticated user."""
-    q = select(Task).where(Task.id == task_id, Task.owner_id == current_user.id)
-    result = await db.execute(q)
-    task = result.scalar_one_or_none()
-    if not task:
+    # Single DELETE ... RETURNING round-trip; no prior SELECT needed
+    result = await db.execute(_delete_task_stmt, {"task_id": task_id, "owner_id": user_id})
+    deleted_id = result.scalar_one_or_none()
+    if deleted_id is None:
         raise HTTPException(status_code=404, detail="Task not found.")
-    await db.delete(task)
     await db.commit()
     return None
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 from typing import Optional
 from datetime import datetime
 
@@ -18,6 +18,8 @@ class UserLogin(BaseModel):
 # PUBLIC_INTERFACE
 class UserRead(BaseModel):
     """Schema for returning user details (public)."""
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     username: str
     email: EmailStr
@@ -26,6 +28,8 @@ class UserRead(BaseModel):
 # PUBLIC_INTERFACE
 class Token(BaseModel):
     """JWT token returned to the authenticated client."""
+    model_config = ConfigDict(from_attributes=True)
+
     access_token: str
     token_type: str
 
@@ -47,6 +51,8 @@ class TaskUpdate(BaseModel):
 # PUBLIC_INTERFACE
 class TaskRead(BaseModel):
     """Return schema for a task."""
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     title: str
     description: Optional[str]